@@ -1,16 +1,37 @@
+import numpy as np
 import pandas as pd
+import streamlit as st
 
 from src.chart import Chart, RowChart
+from src.fastroll import multi_rolling_mean
 from src.streamlit_app import DataVisualizationApp
 
 
 app = DataVisualizationApp("Combined Chart and Table Example")
 
+
+@st.cache_data(show_spinner=False)
+def load_btc(path: str) -> pd.DataFrame:
+    """Load the sample BTC candles and derive the moving averages once."""
+    df = pd.read_csv(
+        path,
+        engine="pyarrow",
+        dtype={"open_time": "int64", "close_time": "int64"},
+    )
+    # Timestamps are integer microseconds, so reinterpret them in place
+    df["open_time"] = df["open_time"].to_numpy(dtype="int64").view("datetime64[us]")
+    df["close_time"] = df["close_time"].to_numpy(dtype="int64").view("datetime64[us]")
+    close = df["close"].to_numpy(np.float64)
+    windows = np.array([5, 20, 60], dtype=np.int64)
+    ma = np.empty((len(windows), len(close)), dtype=np.float64)
+    multi_rolling_mean(close, windows, ma)
+    for window, values in zip(windows, ma):
+        df[f"ma{window}"] = values
+    return df
+
+
 # Prepare sample data
-df = pd.read_csv("btc_data.csv")
-df["open_time"] = pd.to_datetime(df["open_time"], unit="us")
-df["close_time"] = pd.to_datetime(df["close_time"], unit="us")
-df["ma"] = df["close"].rolling(window=20).mean()
+df = load_btc("btc_data.csv")
 
 # Build chart using the common Chart API from src/chart.py
 chart = Chart("Example Combined Chart")
@@ -29,7 +50,7 @@ row2.add_candlestick_chart(
     y_close="close",
     name="Sample Candlestick"
 )
-row2.add_line_plot(df, x="open_time", y="ma", name="20-period MA")
+row2.add_line_plot(df, x="open_time", y="ma20", name="20-period MA")
 chart.add_row(row2)
 
 chart_figure = chart.create_chart()
@@ -6,10 +6,16 @@ Expose commonly used classes and helpers for convenient imports:
 >>> from data_visualization import Chart, RowChart, DataVisualizationApp, streaming_chart
 """
 
+import plotly.io as pio
+
 from .chart import Chart, RowChart
 from .streamlit_app import DataVisualizationApp
 from .streaming_chart import streaming_chart
 
+# Encode figures with orjson, which writes NumPy arrays natively instead of
+# walking them element by element in Python
+pio.json.config.default_engine = "orjson"
+
 __all__ = [
     "Chart",
     "RowChart",
@@ -4,11 +4,93 @@ This module provides classes for creating interactive charts using Plotly,
 including candlestick charts, line plots, and bar plots with multi-row layouts.
 """
 
+import hashlib
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+
+import numpy as np
 import plotly.graph_objects as go
-from plotly.subplots import make_subplots
 import pandas as pd
 from typing import Optional
 
+from .downsample import downsample_indices
+
+# Figures built by Chart.create_chart, keyed by Chart._fingerprint().
+# The cache is shared by every Streamlit session, so it is guarded by a
+# lock and its figures are never handed out directly (see _copy_figure).
+_FIGURE_CACHE: "OrderedDict[tuple, go.Figure]" = OrderedDict()
+_FIGURE_CACHE_SIZE = 16
+_FIGURE_CACHE_LOCK = threading.Lock()
+
+# Trace properties rebound when a figure is reused for new data
+_TRACE_DATA_PROPS = ("x", "y", "open", "high", "low", "close", "name")
+
+# Vertical gap between rows, as a fraction of the plotting area
+_VERTICAL_SPACING = 0.1
+
+
+def _digest(values: "pd.DataFrame | np.ndarray") -> str:
+    """Return a digest of the contents of a frame or array.
+
+    Used in figure cache keys, so equal data loaded into a new object (e.g.
+    a copy returned by ``st.cache_data``) still hits the cache.
+    """
+    if isinstance(values, pd.DataFrame):
+        data = pd.util.hash_pandas_object(values, index=False).to_numpy()
+    else:
+        data = np.ascontiguousarray(values)
+    return hashlib.blake2b(data.tobytes(), digest_size=16).hexdigest()
+
+
+def _copy_figure(fig: go.Figure) -> go.Figure:
+    """Return an independent copy of a figure.
+
+    Traces are copied object by object rather than through ``to_dict``,
+    which would turn the NumPy arrays into base64 or string payloads.
+    """
+    return go.Figure(data=[type(trace)(trace) for trace in fig.data], layout=go.Layout(fig.layout))
+
+
+@lru_cache(maxsize=32)
+def _subplot_layout(heights: tuple[int, ...]) -> dict:
+    """Build the layout of a single-column grid of rows sharing the x-axis.
+
+    Produces the same axes as ``make_subplots(rows=len(heights), cols=1,
+    shared_xaxes=True, row_heights=heights, vertical_spacing=0.1)`` without
+    going through its per-trace grid bookkeeping. The result is cached and
+    must not be mutated.
+
+    Args:
+        heights: Row heights in pixels, top to bottom
+
+    Returns:
+        Layout dictionary with axis domains, anchors and range sliders
+    """
+    row_count = len(heights)
+    available = 1.0 - _VERTICAL_SPACING * (row_count - 1)
+    total = sum(heights)
+    bottom_x = f"x{row_count}" if row_count > 1 else "x"
+
+    layout: dict = {"height": total + 100}
+    top = 1.0
+    for row_index, height in enumerate(heights, start=1):
+        suffix = str(row_index) if row_index > 1 else ""
+        bottom = max(top - available * height / total, 0.0)
+        xaxis = {"anchor": f"y{suffix}", "domain": (0.0, 1.0)}
+        if row_index < row_count:
+            xaxis.update(matches=bottom_x, showticklabels=False)
+        layout[f"xaxis{suffix}"] = xaxis
+        layout[f"yaxis{suffix}"] = {"anchor": f"x{suffix}", "domain": (bottom, top)}
+        top = bottom - _VERTICAL_SPACING
+
+    layout["xaxis"]["rangeslider"] = {"visible": False}
+    layout[f"xaxis{row_count if row_count > 1 else ''}"]["rangeslider"] = {
+        "visible": True,
+        "thickness": 0.03,
+    }
+    return layout
+
 
 class QuickChart:
     """Quick chart templates for common chart types.
@@ -100,6 +182,8 @@ class Chart:
         """
         self.title = title
         self.rows: list[RowChart] = []
+        self._fig: Optional[go.Figure] = None
+        self._fig_shape: Optional[tuple] = None
 
     def set_title(self, title: str) -> None:
         """Set or update the chart title.
@@ -121,30 +205,108 @@ class Chart:
         self.rows.append(row)
         return row
 
+    def _fingerprint(self) -> tuple:
+        """Return a key describing the chart contents.
+
+        The key combines the title, row heights and the labels recorded
+        by each RowChart.add_* call, which include a digest of the plotted
+        columns, so two charts built from equal data with the same settings
+        share a key.
+        """
+        return (
+            self.title,
+            tuple(row.height for row in self.rows),
+            tuple(tuple(row._labels) for row in self.rows),
+        )
+
     def create_chart(self) -> go.Figure:
         """Create and return the complete Plotly figure.
 
         This method combines all row charts into a single figure with
-        shared x-axes and proper layout configuration.
+        shared x-axes and proper layout configuration. Figures are memoized
+        by the chart fingerprint, so rebuilding an unchanged chart (e.g. on
+        a Streamlit rerun) copies the previously built figure.
+
+        When only the trace data changed, the figure previously built by
+        this Chart is updated in place rather than rebuilt.
 
         Returns:
-            A Plotly Figure object ready for display or export
+            A Plotly Figure object ready for display or export; it belongs
+            to the caller and may be modified freely
+        """
+        key = self._fingerprint()
+        with _FIGURE_CACHE_LOCK:
+            cached = _FIGURE_CACHE.get(key)
+            if cached is not None:
+                _FIGURE_CACHE.move_to_end(key)
+        if cached is not None:
+            return _copy_figure(cached)
+
+        shape = self._shape()
+        if self._fig is not None and self._fig_shape == shape:
+            fig = self._rebind_figure()
+        else:
+            fig = self._build_figure()
+            self._fig = fig
+            self._fig_shape = shape
+        with _FIGURE_CACHE_LOCK:
+            _FIGURE_CACHE[key] = _copy_figure(fig)
+            if len(_FIGURE_CACHE) > _FIGURE_CACHE_SIZE:
+                _FIGURE_CACHE.popitem(last=False)
+        return _copy_figure(fig)
+
+    def _shape(self) -> tuple:
+        """Return the layout-defining part of the chart.
+
+        Two states with the same shape produce identical layouts and trace
+        types, so only the trace data differs between them.
         """
-        heights = [row.height for row in self.rows]
-        row_count = len(self.rows)
-        fig = make_subplots(
-            rows=row_count,
-            cols=1,
-            shared_xaxes=True,
-            row_heights=heights,
-            vertical_spacing=0.1
+        return tuple(
+            (row.height, tuple(type(chart).__name__ for chart in row.charts))
+            for row in self.rows
         )
+
+    def _rebind_figure(self) -> go.Figure:
+        """Copy the current trace data into the previously built figure.
+
+        The figure is private to this Chart; the cache and callers only
+        ever receive copies of it.
+        """
+        fig = self._fig
+        new_traces = [chart for row in self.rows for chart in row.charts]
+        with fig.batch_update():
+            for trace, new in zip(fig.data, new_traces):
+                for prop in _TRACE_DATA_PROPS:
+                    value = getattr(new, prop, None)
+                    if value is not None:
+                        setattr(trace, prop, value)
+            fig.layout.title = self.title
+        return fig
+
+    def _build_figure(self) -> go.Figure:
+        """Build a new Plotly figure from the current rows.
+
+        Traces were validated when the RowChart created them, so the figure
+        is assembled in one constructor call with validation disabled and
+        the subplot layout comes from a cached dictionary.
+        """
+        heights = tuple(row.height for row in self.rows)
+        # Validation is skipped, so the title must already be in its
+        # object form (plotly.js no longer accepts a bare string)
+        layout = dict(_subplot_layout(heights), title={"text": self.title})
+        traces = []
+        axes = []
         for row_index, row in enumerate(self.rows, start=1):
+            suffix = str(row_index) if row_index > 1 else ""
             for chart in row.charts:
-                fig.add_trace(chart, row=row_index, col=1)
-        fig.update_layout(title=self.title)
-        fig.update_layout(xaxis_rangeslider_visible=False, height=sum(heights) + 100)
-        fig.update_layout({f"xaxis{row_count}": {"rangeslider": {"visible": True, "thickness": 0.03}}})
+                traces.append(chart)
+                axes.append((f"x{suffix}", f"y{suffix}"))
+
+        fig = go.Figure(data=traces, layout=layout, _validate=False)
+        with fig.batch_update():
+            for trace, (xref, yref) in zip(fig.data, axes):
+                trace.xaxis = xref
+                trace.yaxis = yref
         return fig
 
 
@@ -158,12 +320,18 @@ class RowChart:
         charts: List of Plotly trace objects
         title: Title for this row
         height: Height of this row in pixels
+        dtype: NumPy dtype float y values are cast to before plotting;
+            float32 halves the payload at display-level precision. Integer
+            columns keep their dtype so large counts stay exact. Set to
+            None to keep the source dtype.
 
     Example:
         >>> row = RowChart("Volume", height=200)
         >>> row.add_bar_plot(df, x="date", y="volume", name="Volume")
     """
 
+    dtype: Optional[type] = np.float32
+
     def __init__(self, title: str = "", height: int = 300) -> None:
         """Initialize a RowChart.
 
@@ -174,6 +342,7 @@ class RowChart:
         self.charts: list[go.Trace] = []
         self.title: str = title
         self.height: int = height
+        self._labels: list[tuple] = []
 
     def set_title(self, title: str) -> None:
         """Set or update the row title.
@@ -191,25 +360,61 @@ class RowChart:
         """
         self.height = height
 
+    def _add_label(self, label: tuple) -> None:
+        """Record the identity label of a trace for figure caching.
+
+        Args:
+            label: Small tuple identifying the trace kind, data and columns
+        """
+        self._labels.append(label + (self.dtype,))
+
+    def _values(self, values: "pd.Series | pd.DataFrame") -> np.ndarray:
+        """Return y-axis values, cast to ``dtype`` if all columns are floats.
+
+        Args:
+            values: Column, or frame of columns, to convert
+
+        Returns:
+            NumPy array of the values
+        """
+        dtypes = values.dtypes if isinstance(values, pd.DataFrame) else [values.dtype]
+        if self.dtype is not None and all(pd.api.types.is_float_dtype(dtype) for dtype in dtypes):
+            return values.to_numpy(dtype=self.dtype, copy=False)
+        return values.to_numpy(copy=False)
+
     def add_line_plot(
         self,
         data: pd.DataFrame,
         x: str,
         y: str,
         name: str,
+        max_points: Optional[int] = 4000,
     ) -> go.Scatter:
         """Add a line plot to this row.
 
+        Series longer than ``max_points`` are downsampled with LTTB before
+        being added, which keeps the visual shape while shrinking the payload
+        sent to the browser.
+
         Args:
             data: DataFrame containing the data
             x: Column name for x-axis values
             y: Column name for y-axis values
             name: Name for the trace (shown in legend)
+            max_points: Maximum number of points to plot; None disables
+                downsampling (default: 4000)
 
         Returns:
             The created Scatter trace object
         """
-        trace = go.Scatter(x=data[x], y=data[y], mode='lines', name=name)
+        x_values = data[x].to_numpy()
+        y_values = self._values(data[y])
+        if max_points is not None and len(data) > max_points:
+            idx = downsample_indices(data[x], data[y], max_points)
+            x_values = x_values[idx]
+            y_values = y_values[idx]
+        trace = go.Scatter(x=x_values, y=y_values, mode='lines', name=name)
+        self._add_label(("line", _digest(data[[x, y]]), x, y, name, max_points))
         self.charts.append(trace)
         return trace
 
@@ -231,7 +436,8 @@ class RowChart:
         Returns:
             The created Bar trace object
         """
-        trace = go.Bar(x=data[x], y=data[y], name=name)
+        trace = go.Bar(x=data[x].to_numpy(), y=self._values(data[y]), name=name)
+        self._add_label(("bar", _digest(data[[x, y]]), x, y, name))
         self.charts.append(trace)
         return trace
 
@@ -244,9 +450,13 @@ class RowChart:
         y_low: str = "low",
         y_close: str = "close",
         name: str = "Candlestick",
+        ohlc_matrix: Optional[np.ndarray] = None,
     ) -> go.Candlestick:
         """Add a candlestick chart to this row.
 
+        The four price columns are extracted with a single frame lookup
+        into an (N, 4) array whose columns are then passed as views.
+
         Args:
             data: DataFrame containing OHLC data
             x: Column name for x-axis (typically time/date)
@@ -255,17 +465,29 @@ class RowChart:
             y_low: Column name for low prices
             y_close: Column name for close prices
             name: Name for the trace (shown in legend)
+            ohlc_matrix: Optional precomputed (N, 4) array of open, high,
+                low and close prices; when given, the y_* columns are ignored
 
         Returns:
             The created Candlestick trace object
         """
+        if ohlc_matrix is None:
+            columns = (y_open, y_high, y_low, y_close)
+            ohlc = self._values(data[list(columns)])
+            digest = _digest(data[[x, *columns]])
+        else:
+            columns = (ohlc_matrix.shape, ohlc_matrix.dtype.str)
+            ohlc = ohlc_matrix
+            digest = (_digest(data[[x]]), _digest(ohlc_matrix))
+        open_, high, low, close = ohlc.T
         trace = go.Candlestick(
-            x=data[x],
-            open=data[y_open],
-            high=data[y_high],
-            low=data[y_low],
-            close=data[y_close],
+            x=data[x].to_numpy(),
+            open=open_,
+            high=high,
+            low=low,
+            close=close,
             name=name,
         )
+        self._add_label(("candlestick", digest, x, columns, name))
         self.charts.append(trace)
         return trace
@@ -0,0 +1,91 @@
+"""Downsampling utilities for large line-plot series.
+
+This module implements Largest-Triangle-Three-Buckets (LTTB) downsampling
+with Numba, which reduces long time series to a few thousand points while
+preserving their visual shape.
+"""
+
+import numpy as np
+import pandas as pd
+from numba import njit
+
+
+@njit(cache=True)
+def lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """Select the indices of the points kept by LTTB downsampling.
+
+    Args:
+        x: 1-D float64 array of x values (monotonically increasing)
+        y: 1-D float64 array of y values
+        n_out: Number of points to keep
+
+    Returns:
+        Sorted int64 array of selected indices, always including the first
+        and last points
+    """
+    n = x.shape[0]
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    out = np.empty(n_out, dtype=np.int64)
+    out[0] = 0
+    every = (n - 2) / (n_out - 2)
+    a = 0
+    for i in range(n_out - 2):
+        # Average point of the next bucket
+        avg_start = int((i + 1) * every) + 1
+        avg_end = min(int((i + 2) * every) + 1, n)
+        avg_x = 0.0
+        avg_y = 0.0
+        for j in range(avg_start, avg_end):
+            avg_x += x[j]
+            avg_y += y[j]
+        count = avg_end - avg_start
+        avg_x /= count
+        avg_y /= count
+
+        # Point of the current bucket forming the largest triangle
+        range_start = int(i * every) + 1
+        range_end = int((i + 1) * every) + 1
+        max_area = -1.0
+        next_a = range_start
+        for j in range(range_start, range_end):
+            area = abs(
+                (x[a] - avg_x) * (y[j] - y[a])
+                - (x[a] - x[j]) * (avg_y - y[a])
+            )
+            if area > max_area:
+                max_area = area
+                next_a = j
+        out[i + 1] = next_a
+        a = next_a
+
+    out[n_out - 1] = n - 1
+    return out
+
+
+def downsample_indices(x: pd.Series, y: pd.Series, max_points: int) -> np.ndarray:
+    """Return the row positions to keep when plotting ``y`` against ``x``.
+
+    Datetime x values are compared as int64 timestamps; non-numeric x
+    values fall back to the row position. Non-numeric y values have no
+    triangle areas to compare, so every row is kept.
+
+    Args:
+        x: Series of x-axis values
+        y: Series of y-axis values
+        max_points: Maximum number of points to keep
+
+    Returns:
+        Sorted int64 array of row positions
+    """
+    if not pd.api.types.is_numeric_dtype(y.dtype):
+        return np.arange(len(y))
+    if pd.api.types.is_datetime64_any_dtype(x.dtype):
+        x_arr = x.to_numpy(dtype="datetime64[ns]").view("i8").astype(np.float64)
+    elif pd.api.types.is_numeric_dtype(x.dtype):
+        x_arr = x.to_numpy(dtype=np.float64)
+    else:
+        x_arr = np.arange(len(x), dtype=np.float64)
+    y_arr = y.to_numpy(dtype=np.float64)
+    return lttb_indices(x_arr, y_arr, max_points)
@@ -4,10 +4,14 @@ This module provides utilities for exporting DataFrames and Plotly figures
 to different file formats, including Markdown with embedded images.
 """
 
+import io
 import os
 from typing import Optional
 
 import pandas as pd
+import plotly.io as pio
+import pyarrow as pa
+import pyarrow.compute as pc
 from plotly import graph_objects as go
 
 
@@ -42,23 +46,97 @@ class Exporter:
             os.makedirs(name_path)
 
         md_filename = f"{name_path}/{name_path}_markdown.md"
-        md_imagename = f"{name_path}/{name_path}_image.png"
         try:
-            # Save figure as image
-            for i, fig in enumerate(fig_list):
-                md_imagename = f"{name_path}/{name_path}_image{i}.png"
-                fig.write_image(md_imagename)
-
-            with open(md_filename, "w") as f:
-                for df in df_list:
-                    f.write(df.to_markdown(index=False))
-                    f.write("\n\n")
-                for i in range(len(fig_list)):
-                    imagepath = f"{name_path}_image{i}.png"
-                    f.write(f"![Chart]({imagepath})\n")
+            # Save figures as images
+            Exporter._write_images(
+                fig_list,
+                [f"{name_path}/{name_path}_image{i}.png" for i in range(len(fig_list))],
+            )
+
+            buf = io.StringIO()
+            for df in df_list:
+                buf.write(Exporter._to_markdown(df))
+                buf.write("\n\n")
+            for i in range(len(fig_list)):
+                imagepath = f"{name_path}_image{i}.png"
+                buf.write(f"![Chart]({imagepath})\n")
+
+            with open(md_filename, "w", buffering=1 << 20) as f:
+                f.write(buf.getvalue())
 
         except Exception as e:
             print(f"Error exporting to Markdown: {e}")
             return False
 
         return True
+
+    @staticmethod
+    def _write_images(fig_list: list[go.Figure], paths: list[str]) -> None:
+        """Render figures to image files.
+
+        With Kaleido v1 (plotly >= 6.1) all figures go to Kaleido in one
+        ``pio.write_images`` batch, which renders them concurrently on a
+        single browser. Older Kaleido renders through one subprocess behind
+        a lock, so the figures are written one after another.
+
+        Args:
+            fig_list: Figures to render
+            paths: Output path of each figure; the format follows the extension
+        """
+        if not fig_list:
+            return
+        try:
+            import kaleido
+        except ImportError:
+            kaleido = None
+        if hasattr(pio, "write_images") and hasattr(kaleido, "write_fig_from_object_sync"):
+            pio.write_images(fig_list, paths)
+            return
+        for fig, path in zip(fig_list, paths):
+            fig.write_image(path)
+
+    @staticmethod
+    def _to_markdown(df: pd.DataFrame) -> str:
+        """Format a DataFrame as a Markdown pipe table.
+
+        Cells are formatted column-wise with pyarrow compute kernels instead
+        of tabulate's per-row Python loop; datetime and timedelta values are
+        printed with str() and booleans as True/False, as tabulate does.
+        Columns are not padded, missing values are left empty and numbers
+        use Arrow's text form. Falls back to ``df.to_markdown`` when a
+        column cannot be cast to text.
+
+        Args:
+            df: DataFrame to format (the index is not included)
+
+        Returns:
+            Markdown table as a string
+        """
+        def escape(text: str) -> str:
+            return text.replace("|", "\\|")
+
+        header = "| " + " | ".join(escape(str(c)) for c in df.columns) + " |"
+        separator = "|" + "|".join("---" for _ in df.columns) + "|"
+        if len(df) == 0 or len(df.columns) == 0:
+            return header + "\n" + separator
+
+        try:
+            cells = []
+            for i in range(len(df.columns)):
+                column = df.iloc[:, i]
+                if (pd.api.types.is_datetime64_any_dtype(column.dtype)
+                        or pd.api.types.is_timedelta64_dtype(column.dtype)):
+                    # Print each value as str() does, like tabulate
+                    text = pa.array(column.map(str), type=pa.string())
+                elif pd.api.types.is_bool_dtype(column.dtype):
+                    text = pc.if_else(pa.array(column, from_pandas=True), "True", "False")
+                else:
+                    text = pc.cast(pa.array(column, from_pandas=True), pa.string())
+                text = pc.fill_null(text, "")
+                cells.append(pc.replace_substring(text, "|", "\\|"))
+        except (ValueError, TypeError, pa.ArrowInvalid, pa.ArrowTypeError,
+                pa.ArrowNotImplementedError):
+            return df.to_markdown(index=False)
+
+        rows = pc.binary_join_element_wise("| ", pc.binary_join_element_wise(*cells, " | "), " |", "")
+        return header + "\n" + separator + "\n" + "\n".join(rows.to_pylist())
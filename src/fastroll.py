@@ -0,0 +1,78 @@
+"""Fast rolling-window kernels compiled with Numba.
+
+This module provides JIT-compiled replacements for pandas rolling
+aggregations that are used when preparing chart data, such as moving
+averages over price columns.
+"""
+
+import numpy as np
+from numba import njit, prange
+
+
+@njit(cache=True)
+def rolling_mean(x: np.ndarray, w: int, out: np.ndarray) -> None:
+    """Compute a trailing rolling mean of ``x`` into ``out``.
+
+    Uses a single pass with a running sum, so the cost is O(N) regardless
+    of the window size. Like ``pd.Series.rolling(window=w).mean()``, the
+    first ``w - 1`` positions and every window containing a NaN are NaN;
+    values after the NaN leaves the window are unaffected.
+
+    Args:
+        x: 1-D float64 input array
+        w: Window length (must be >= 1)
+        out: Preallocated float64 output array with the same length as ``x``
+
+    Example:
+        >>> arr = df["close"].to_numpy(np.float64)
+        >>> out = np.empty_like(arr)
+        >>> rolling_mean(arr, 20, out)
+    """
+    n = x.shape[0]
+    total = 0.0
+    nans = 0
+    for i in range(n):
+        if np.isnan(x[i]):
+            nans += 1
+        else:
+            total += x[i]
+        if i >= w:
+            if np.isnan(x[i - w]):
+                nans -= 1
+            else:
+                total -= x[i - w]
+        if i >= w - 1 and nans == 0:
+            out[i] = total / w
+        else:
+            out[i] = np.nan
+
+
+@njit(parallel=True, cache=True)
+def multi_rolling_mean(x: np.ndarray, windows: np.ndarray, out: np.ndarray) -> None:
+    """Compute trailing rolling means of ``x`` for several windows at once.
+
+    Each window is computed with the running-sum kernel of
+    :func:`rolling_mean`, and windows are processed in parallel.
+
+    Args:
+        x: 1-D float64 input array
+        windows: 1-D int64 array of window lengths
+        out: Preallocated float64 array of shape ``(len(windows), len(x))``
+
+    Example:
+        >>> windows = np.array([5, 20, 60], dtype=np.int64)
+        >>> out = np.empty((len(windows), len(arr)))
+        >>> multi_rolling_mean(arr, windows, out)
+    """
+    for k in prange(windows.shape[0]):
+        rolling_mean(x, windows[k], out[k])
+
+
+# Warm the JIT once at import so the first real call does not pay for
+# compilation (subsequent processes reuse the on-disk cache).
+rolling_mean(np.zeros(2, dtype=np.float64), 1, np.empty(2, dtype=np.float64))
+multi_rolling_mean(
+    np.zeros(2, dtype=np.float64),
+    np.ones(1, dtype=np.int64),
+    np.empty((1, 2), dtype=np.float64),
+)
@@ -1,8 +1,54 @@
-import os
+from functools import lru_cache
+from string import Template
+
 import streamlit.components.v1 as components
 
-# Get the path to the frontend folder
-_COMPONENT_PATH = os.path.join(os.path.dirname(__file__), "frontend")
+from .build_assets import BUNDLE_FILE, CONFIG_MARKER, build_bundle, bundle_is_fresh
+
+# Configuration injected between the static HTML head and the scripts
+_CONFIG_TEMPLATE = Template("""
+    <script>
+        window.STREAMING_CHART_CONFIG = {
+            websocketUrl: "${websocketUrl}",
+            topic: "${topic}",
+            candleInterval: ${candleInterval}
+        };
+    </script>
+    """)
+
+
+def _load_template() -> tuple[str, str]:
+    """Load the bundled page and split it around the configuration script.
+
+    Uses the prebuilt ``frontend/bundle.html`` when it is up to date and
+    falls back to bundling the sources in-process otherwise. The JS sources
+    contain ``${...}`` template literals, so the static parts are kept as
+    plain strings and only the config script is templated.
+
+    Returns:
+        The HTML before and after the configuration script
+    """
+    if bundle_is_fresh():
+        with open(BUNDLE_FILE, "r") as f:
+            bundle = f.read()
+    else:
+        bundle = build_bundle()
+    head, tail = bundle.split(CONFIG_MARKER, 1)
+    return head, tail
+
+
+_HTML_HEAD, _HTML_TAIL = _load_template()
+
+
+@lru_cache(maxsize=32)
+def _render_html(websocket_url: str, topic: str, candle_interval: int) -> str:
+    """Assemble the full component HTML for a given configuration."""
+    config_script = _CONFIG_TEMPLATE.substitute(
+        websocketUrl=websocket_url,
+        topic=topic,
+        candleInterval=candle_interval,
+    )
+    return _HTML_HEAD + config_script + _HTML_TAIL
 
 
 def streaming_chart(
@@ -24,72 +70,5 @@ def streaming_chart(
     Returns:
         None
     """
-    # Read the HTML template
-    html_file = os.path.join(_COMPONENT_PATH, "index.html")
-    css_file = os.path.join(_COMPONENT_PATH, "style.css")
-    js_file = os.path.join(_COMPONENT_PATH, "main.js")
-    msgpack_file = os.path.join(_COMPONENT_PATH, "msgpack.js")
-
-    with open(html_file, "r") as f:
-        html_content = f.read()
-
-    with open(css_file, "r") as f:
-        css_content = f.read()
-
-    with open(js_file, "r") as f:
-        js_content = f.read()
-
-    with open(msgpack_file, "r") as f:
-        msgpack_content = f.read()
-
-    # Remove the ES module import/export statements since we're inlining
-    # Remove import statement from main.js
-    js_content = js_content.replace(
-        "import { decodeMessage, encodeMessage } from './msgpack.js';", ""
-    )
-    # Remove export statement from msgpack.js
-    msgpack_content = msgpack_content.replace(
-        "export { encodeMessage, decodeMessage };", ""
-    )
-
-    # Inject configuration into the component
-    config_script = f"""
-    <script>
-        window.STREAMING_CHART_CONFIG = {{
-            websocketUrl: "{websocket_url}",
-            topic: "{topic}",
-            candleInterval: {candle_interval}
-        }};
-    </script>
-    """
-
-    # Combine all parts into a single HTML
-    full_html = f"""
-    <!DOCTYPE html>
-    <html>
-    <head>
-        <meta charset="UTF-8">
-        <meta name="viewport" content="width=device-width, initial-scale=1.0">
-        <script
-            src="https://unpkg.com/lightweight-charts@4.1.0/dist/lightweight-charts.standalone.production.js">
-        </script>
-        <style>
-        {css_content}
-        </style>
-    </head>
-    <body>
-        {html_content}
-        {config_script}
-        <script>
-        // Msgpack decoder/encoder
-        {msgpack_content}
-        </script>
-        <script>
-        // Main chart script
-        {js_content}
-        </script>
-    </body>
-    </html>
-    """
-
+    full_html = _render_html(websocket_url, topic, candle_interval)
     components.html(full_html, height=height, scrolling=False)
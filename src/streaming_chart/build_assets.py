@@ -0,0 +1,100 @@
+"""Build the inlined HTML bundle for the streaming chart component.
+
+The frontend is authored as ES modules (main.js imports msgpack.js), but
+Streamlit renders the component from a single HTML string. This script
+inlines the CSS and scripts into ``frontend/bundle.html`` ahead of time so
+the component only has to read one file at import.
+
+Usage:
+    python src/streaming_chart/build_assets.py
+"""
+
+import os
+
+FRONTEND_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "frontend")
+BUNDLE_FILE = os.path.join(FRONTEND_PATH, "bundle.html")
+SOURCE_FILES = ("index.html", "style.css", "main.js", "msgpack.js")
+
+# Placeholder replaced by the per-chart configuration script
+CONFIG_MARKER = "<!-- STREAMING_CHART_CONFIG -->"
+
+
+def build_bundle() -> str:
+    """Inline the frontend sources into a single HTML page.
+
+    Returns:
+        The bundled HTML, with ``CONFIG_MARKER`` where the configuration
+        script must be inserted
+    """
+    def read(name: str) -> str:
+        with open(os.path.join(FRONTEND_PATH, name), "r") as f:
+            return f.read()
+
+    html_content = read("index.html")
+    css_content = read("style.css")
+    js_content = read("main.js")
+    msgpack_content = read("msgpack.js")
+
+    # Remove the ES module import/export statements since we're inlining
+    # Remove import statement from main.js
+    js_content = js_content.replace(
+        "import { decodeMessage, encodeMessage } from './msgpack.js';", ""
+    )
+    # Remove export statement from msgpack.js
+    msgpack_content = msgpack_content.replace(
+        "export { encodeMessage, decodeMessage };", ""
+    )
+
+    return f"""
+    <!DOCTYPE html>
+    <html>
+    <head>
+        <meta charset="UTF-8">
+        <meta name="viewport" content="width=device-width, initial-scale=1.0">
+        <script
+            src="https://unpkg.com/lightweight-charts@4.1.0/dist/lightweight-charts.standalone.production.js">
+        </script>
+        <style>
+        {css_content}
+        </style>
+    </head>
+    <body>
+        {html_content}
+        {CONFIG_MARKER}
+        <script>
+        // Msgpack decoder/encoder
+        {msgpack_content}
+        </script>
+        <script>
+        // Main chart script
+        {js_content}
+        </script>
+    </body>
+    </html>
+    """
+
+
+def bundle_is_fresh() -> bool:
+    """Return True if bundle.html exists and is newer than every source file."""
+    if not os.path.exists(BUNDLE_FILE):
+        return False
+    bundle_mtime = os.path.getmtime(BUNDLE_FILE)
+    return all(
+        os.path.getmtime(os.path.join(FRONTEND_PATH, name)) <= bundle_mtime
+        for name in SOURCE_FILES
+    )
+
+
+def write_bundle() -> str:
+    """Build the bundle and write it to ``frontend/bundle.html``.
+
+    Returns:
+        Path of the written bundle
+    """
+    with open(BUNDLE_FILE, "w") as f:
+        f.write(build_bundle())
+    return BUNDLE_FILE
+
+
+if __name__ == "__main__":
+    print(f"Wrote {write_bundle()}")
@@ -40,6 +40,14 @@ import { decodeMessage, encodeMessage } from './msgpack.js';
     let currentCandle = null; // Current forming candle
     let candleData = []; // Historical candles
 
+    // Every tick is folded into the candle state on arrival; drawing is
+    // deferred to the next animation frame. Candles finished in between
+    // (e.g. while the tab is hidden and frames are paused) wait in
+    // pendingCandles so none of them is lost.
+    let pendingCandles = [];
+    let latestTick = null; // { price, timestampMs, volume, symbol }
+    let renderScheduled = false;
+
     // Initialize the chart
     function initChart() {
         if (!chartContainer) return;
@@ -197,7 +205,7 @@ import { decodeMessage, encodeMessage } from './msgpack.js';
         return Math.floor(timestamp / candleInterval) * candleInterval;
     }
 
-    // Update or create candle with new price data
+    // Update or create candle with new price data (state only, see renderCandle)
     function updateCandle(price, timestamp, volume) {
         const candleTime = getCandleTime(timestamp);
 
@@ -205,12 +213,17 @@ import { decodeMessage, encodeMessage } from './msgpack.js';
         if (currentCandle === null || currentCandle.time !== candleTime) {
             // Save the previous candle to history if exists
             if (currentCandle !== null) {
+                // Draw the final state of the finished candle on the next frame
+                pendingCandles.push(currentCandle);
                 candleData.push({ ...currentCandle });
 
                 // Limit historical candles
                 if (candleData.length > maxDataPoints) {
                     candleData.shift();
                 }
+                if (pendingCandles.length > maxDataPoints) {
+                    pendingCandles.shift();
+                }
             }
 
             // Create new candle
@@ -231,29 +244,62 @@ import { decodeMessage, encodeMessage } from './msgpack.js';
                 currentCandle.volume = volume;
             }
         }
+    }
 
-        // Update chart with current candle
+    // Push a candle to the chart series
+    function renderCandle(candle) {
         if (candlestickSeries) {
             candlestickSeries.update({
-                time: currentCandle.time,
-                open: currentCandle.open,
-                high: currentCandle.high,
-                low: currentCandle.low,
-                close: currentCandle.close
+                time: candle.time,
+                open: candle.open,
+                high: candle.high,
+                low: candle.low,
+                close: candle.close
             });
         }
 
         // Update volume chart
         if (volumeSeries) {
-            const isUp = currentCandle.close >= currentCandle.open;
+            const isUp = candle.close >= candle.open;
             volumeSeries.update({
-                time: currentCandle.time,
-                value: currentCandle.volume,
+                time: candle.time,
+                value: candle.volume,
                 color: isUp ? 'rgba(38, 166, 154, 0.5)' : 'rgba(239, 83, 80, 0.5)'
             });
         }
     }
 
+    // Apply a tick to the candle state and schedule a redraw
+    function handleTick(price, timestampMs, volume, symbol) {
+        updateCandle(price, timestampMs / 1000, volume);
+        latestTick = { price, timestampMs, volume, symbol };
+
+        if (!renderScheduled) {
+            renderScheduled = true;
+            requestAnimationFrame(render);
+        }
+    }
+
+    // Draw the candles and UI elements changed since the last frame
+    function render() {
+        renderScheduled = false;
+        if (latestTick === null) return;
+
+        for (const candle of pendingCandles) {
+            renderCandle(candle);
+        }
+        pendingCandles = [];
+        renderCandle(currentCandle);
+
+        // Update UI elements with the latest tick
+        const { price, timestampMs, volume, symbol } = latestTick;
+        updatePriceDisplay(price, symbol);
+        if (volume) {
+            volume24hEl.textContent = formatVolume(volume);
+        }
+        lastUpdateEl.textContent = 'Last update: ' + formatTimestamp(timestampMs);
+    }
+
     // Handle incoming WebSocket message (binary msgpack data)
     async function handleMessage(event) {
         try {
@@ -271,20 +317,11 @@ import { decodeMessage, encodeMessage } from './msgpack.js';
                 parsed = JSON.parse(event.data);
             }
 
-            console.log('Received message:', parsed);
-
             // Check if this is market data
             if (parsed && parsed.type === 'market_data' && parsed.data) {
                 const data = parsed.data;
-                const timestamp = new Date(data.ts).getTime() / 1000; // Convert to Unix timestamp in seconds
-
-                // Update candlestick chart
-                updateCandle(data.price, timestamp, data.volume_24h);
-
-                // Update UI elements
-                updatePriceDisplay(data.price, data.symbol);
-                volume24hEl.textContent = formatVolume(data.volume_24h);
-                lastUpdateEl.textContent = 'Last update: ' + formatTimestamp(data.ts);
+                // The candle is updated now; the chart is redrawn on the next frame
+                handleTick(data.price, new Date(data.ts).getTime(), data.volume_24h, data.symbol);
             }
 
             // Handle ping message - respond with pong
@@ -0,0 +1,151 @@
+"""Server-side ingestion of streaming market data.
+
+This module receives the same WebSocket feed as the browser component and
+appends decoded ticks to a bounded ``deque``. The receive loop runs on its
+own event loop in a background thread, so it is never blocked by Streamlit
+rendering; when consumers fall behind, the deque discards the oldest ticks.
+One loop runs per (url, topic) and is shared by every session.
+
+Requires the optional ``websockets`` and ``ormsgpack`` packages; the
+receive loop runs on ``uvloop`` when it is installed.
+"""
+
+import asyncio
+import json
+import threading
+from collections import deque
+from typing import Optional
+
+import ormsgpack
+import websockets
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+
+async def ingest_loop(
+    url: str,
+    topic: str,
+    buf: deque,
+    reconnect_delay: float = 3.0,
+) -> None:
+    """Receive market data from a WebSocket into ``buf`` until cancelled.
+
+    Malformed frames are skipped, and any connection failure (including an
+    invalid URL) is logged and retried after ``reconnect_delay``, so the
+    loop only ends when its task is cancelled.
+
+    Args:
+        url: The WebSocket URL to connect to
+        topic: The topic to subscribe to (e.g., "market.data@BTC")
+        buf: Bounded deque receiving the ``data`` payload of each
+            market_data message
+        reconnect_delay: Seconds to wait before reconnecting after the
+            connection drops
+    """
+    while True:
+        try:
+            async with websockets.connect(
+                url, max_size=None, compression=None, ping_interval=20
+            ) as ws:
+                if topic:
+                    await ws.send(ormsgpack.packb({"action": "subscribe", "topic": topic}))
+                async for raw in ws:
+                    try:
+                        if isinstance(raw, bytes):
+                            msg = ormsgpack.unpackb(raw)
+                        else:
+                            msg = json.loads(raw)
+                    except (ValueError, TypeError):
+                        continue
+                    if not isinstance(msg, dict):
+                        continue
+
+                    if msg.get("type") == "market_data" and msg.get("data"):
+                        buf.append(msg["data"])
+                    elif msg.get("type") == "ping":
+                        await ws.send(ormsgpack.packb({"type": "pong"}))
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            print(f"Error ingesting from {url} ({topic}): {e}")
+        # Reconnect after both clean closes and connection errors
+        await asyncio.sleep(reconnect_delay)
+
+
+class _Ingester:
+    """One ingest loop running on its own (uvloop if available) event loop.
+
+    The loop is private to the ingest thread, so Streamlit's own event loop
+    policy is left untouched.
+    """
+
+    def __init__(self, url: str, topic: str, buf: deque) -> None:
+        self.buf = buf
+        self._loop = uvloop.new_event_loop() if uvloop is not None else asyncio.new_event_loop()
+        self._task = self._loop.create_task(ingest_loop(url, topic, self.buf))
+        self.thread = threading.Thread(target=self._run, name=f"ingest:{topic}", daemon=True)
+        self.thread.start()
+
+    def _run(self) -> None:
+        try:
+            self._loop.run_until_complete(self._task)
+        except asyncio.CancelledError:
+            pass
+        finally:
+            self._loop.close()
+
+    def stop(self) -> None:
+        """Cancel the ingest loop; the thread exits shortly after."""
+        if self.thread.is_alive():
+            self._loop.call_soon_threadsafe(self._task.cancel)
+
+
+# Running ingesters, shared by every session, keyed by (url, topic)
+_INGESTERS: dict[tuple[str, str], _Ingester] = {}
+_INGESTERS_LOCK = threading.Lock()
+
+
+def start_ingest(url: str, topic: str, maxlen: int = 10000) -> deque:
+    """Start ingesting ``topic`` from ``url``, or join the running ingester.
+
+    There is at most one ingest thread and socket per (url, topic) in the
+    process; every caller receives the same deque, sized by the caller that
+    started it. A dead ingester is restarted on the same deque, so
+    buffers handed out earlier keep receiving ticks.
+
+    Args:
+        url: The WebSocket URL to connect to
+        topic: The topic to subscribe to
+        maxlen: Maximum number of ticks kept; older ticks are discarded
+
+    Returns:
+        The deque the ticks are appended to
+
+    Raises:
+        ValueError: If ``url`` is empty
+    """
+    if not url:
+        raise ValueError("start_ingest requires a WebSocket URL")
+    with _INGESTERS_LOCK:
+        ingester = _INGESTERS.get((url, topic))
+        if ingester is None or not ingester.thread.is_alive():
+            buf = ingester.buf if ingester is not None else deque(maxlen=maxlen)
+            ingester = _Ingester(url, topic, buf)
+            _INGESTERS[(url, topic)] = ingester
+        return ingester.buf
+
+
+def stop_ingest(url: str, topic: str) -> None:
+    """Stop the ingester started by ``start_ingest`` for (url, topic), if any.
+
+    Args:
+        url: The WebSocket URL passed to start_ingest
+        topic: The topic passed to start_ingest
+    """
+    with _INGESTERS_LOCK:
+        ingester: Optional[_Ingester] = _INGESTERS.pop((url, topic), None)
+    if ingester is not None:
+        ingester.stop()
@@ -4,14 +4,25 @@ This module provides a high-level DataVisualizationApp class that combines
 tables, charts, and streaming visualizations in a Streamlit web application.
 """
 
+from collections import deque
+
+import numpy as np
 import streamlit as st
+import streamlit.components.v1 as components
 import pandas as pd
-from typing import Any
+import plotly.io as pio
+from plotly.offline import get_plotlyjs
+from typing import Any, Optional
 
 from .streaming_chart import streaming_chart
 from .table import TableManager
 from .exporter import Exporter
 
+# Streamlit's default template uses placeholder colors that only
+# st.plotly_chart resolves; figures rendered with Plotly.js directly
+# fall back to this template instead.
+_FALLBACK_TEMPLATE = "plotly"
+
 
 class DataVisualizationApp:
     """Main application class for building data visualization dashboards.
@@ -24,6 +35,7 @@ class DataVisualizationApp:
         title: The application title displayed at the top
         tables: List of table configurations to render
         figures: List of Plotly figures to display
+        figure_json: Pre-serialized JSON for each entry in ``figures``
         streaming_charts: List of streaming chart configurations
 
     Example:
@@ -42,6 +54,7 @@ class DataVisualizationApp:
         self.title = title
         self.tables: list[dict] = []
         self.figures: list = []
+        self.figure_json: list[str] = []
         self.streaming_charts: list[dict] = []
 
     def run(self) -> None:
@@ -56,16 +69,13 @@ class DataVisualizationApp:
         for idx, table in enumerate(self.tables):
             self.show_table(table, scope=f"table_{idx}")
 
-        for fig in self.figures:
-            self.show_chart(fig)
+        for idx, fig in enumerate(self.figures):
+            # Figures appended to ``figures`` directly have no stored JSON
+            fig_json = self.figure_json[idx] if idx < len(self.figure_json) else None
+            self.show_chart_fragment(fig, fig_json)
 
         for chart_config in self.streaming_charts:
-            streaming_chart(
-                websocket_url=chart_config.get("websocket_url", ""),
-                topic=chart_config.get("topic", "market.data@BTC"),
-                height=chart_config.get("height", 500),
-                candle_interval=chart_config.get("candle_interval", 60),
-            )
+            self.show_streaming_fragment(chart_config)
 
         if st.button("Export Data", width='content'):
             is_done = Exporter.export_to_markdown(
@@ -115,14 +125,70 @@ class DataVisualizationApp:
             scope=scope
         )
 
-    def show_chart(self, fig: Any) -> None:
+    def show_chart(self, fig: Any, fig_json: str = None) -> None:
         """Display a Plotly figure.
 
+        The figure is rendered with Plotly.js from its pre-serialized JSON,
+        so unchanged figures are not re-encoded on every Streamlit rerun.
+        Plotly.js is inlined from the installed plotly package, so charts
+        render without network access.
+
         Args:
             fig: Plotly Figure object to display
+            fig_json: JSON produced by ``figure_to_json`` for ``fig``;
+                serialized on the fly when omitted
         """
         st.markdown("---")
-        st.plotly_chart(fig)
+        if fig_json is None:
+            fig_json = self.figure_to_json(fig)
+        height = fig.layout.height or 450
+        # Each component lives in its own iframe, so a fixed div id keeps the
+        # HTML identical across reruns. Keep the payload from closing the <script> element early
+        payload = fig_json.replace("</", "<\\/")
+        components.html(
+            f"""
+            <script>{get_plotlyjs()}</script>
+            <div id="chart" style="width: 100%; height: {height}px;"></div>
+            <script>
+                const fig = {payload};
+                for (const [i, k] of fig.x_refs) {{
+                    fig.data[i].x = fig.shared_x[k];
+                }}
+                Plotly.react("chart", fig.data, fig.layout, {{responsive: true}});
+            </script>
+            """,
+            height=height + 20,
+        )
+
+    @st.fragment
+    def show_chart_fragment(self, fig: Any, fig_json: str = None) -> None:
+        """Display a Plotly figure in its own fragment.
+
+        Interactions elsewhere on the page rerun only their own fragment,
+        so the figure is not re-rendered.
+
+        Args:
+            fig: Plotly Figure object to display
+            fig_json: Pre-serialized JSON for ``fig``
+        """
+        self.show_chart(fig, fig_json)
+
+    @st.fragment
+    def show_streaming_fragment(self, chart_config: dict) -> None:
+        """Render a streaming chart in its own fragment.
+
+        Args:
+            chart_config: Streaming chart configuration from add_streaming_chart
+        """
+        if chart_config.get("ingest"):
+            # Restarts the ingester if its thread has died
+            chart_config["buffer"] = self.start_ingest(chart_config)
+        streaming_chart(
+            websocket_url=chart_config.get("websocket_url", ""),
+            topic=chart_config.get("topic", "market.data@BTC"),
+            height=chart_config.get("height", 500),
+            candle_interval=chart_config.get("candle_interval", 60),
+        )
 
     def add_figure(self, fig: Any) -> None:
         """Add a Plotly figure to the application.
@@ -134,8 +200,65 @@ class DataVisualizationApp:
             >>> from plotly import graph_objects as go
             >>> fig = go.Figure(data=[go.Bar(x=[1, 2, 3], y=[4, 5, 6])])
             >>> app.add_figure(fig)
+
+        Note:
+            The figure is serialized once here; later changes to ``fig`` are
+            not reflected in the rendered chart.
         """
         self.figures.append(fig)
+        self.figure_json.append(self.figure_to_json(fig))
+
+    @staticmethod
+    def figure_to_json(fig: Any) -> str:
+        """Serialize a figure, encoding x arrays shared by traces only once.
+
+        Traces with identical x values (e.g. a candlestick and a moving
+        average on the same time axis) have their ``x`` moved to a
+        ``shared_x`` list and referenced from ``x_refs`` as
+        ``[trace_index, shared_index]`` pairs, which show_chart resolves
+        before plotting. Figures using Streamlit's template are serialized
+        with the default Plotly template, since its placeholder colors are
+        only resolved by st.plotly_chart.
+
+        Args:
+            fig: Plotly Figure object to serialize
+
+        Returns:
+            JSON string with "data", "layout", "shared_x" and "x_refs" keys
+        """
+        fig_dict = fig.to_dict()
+        if "streamlit" in pio.templates and fig.layout.template == pio.templates["streamlit"]:
+            fig_dict["layout"]["template"] = pio.templates[_FALLBACK_TEMPLATE].to_plotly_json()
+        traces = fig_dict.get("data", [])
+        groups: list[tuple[np.ndarray, list[int]]] = []
+        for i, trace in enumerate(traces):
+            x = trace.get("x")
+            if not isinstance(x, np.ndarray):
+                continue
+            for values, members in groups:
+                if x is values or (
+                    x.shape == values.shape
+                    and x.dtype == values.dtype
+                    and np.array_equal(x, values)
+                ):
+                    members.append(i)
+                    break
+            else:
+                groups.append((x, [i]))
+
+        shared_x = []
+        x_refs = []
+        for values, members in groups:
+            if len(members) < 2:
+                continue
+            for i in members:
+                del traces[i]["x"]
+                x_refs.append([i, len(shared_x)])
+            shared_x.append(values)
+
+        fig_dict["shared_x"] = shared_x
+        fig_dict["x_refs"] = x_refs
+        return pio.to_json(fig_dict, validate=False, engine="orjson")
 
     def add_streaming_chart(
         self,
@@ -144,7 +267,9 @@ class DataVisualizationApp:
         height: int = 500,
         candle_interval: int = 60,
         key: str = None,
-    ):
+        ingest: bool = False,
+        ingest_maxlen: int = 10000,
+    ) -> Optional[deque]:
         """
         Add a real-time candlestick chart that connects to a WebSocket.
 
@@ -154,11 +279,55 @@ class DataVisualizationApp:
             height: Height of the chart in pixels
             candle_interval: Candlestick interval in seconds (default: 60 = 1 minute)
             key: Unique key for the component
+            ingest: Also receive the feed server-side into a bounded buffer
+                (see start_ingest); requires websockets and ormsgpack
+            ingest_maxlen: Number of ticks kept by server-side ingestion
+
+        Returns:
+            The deque receiving the ingested ticks when ``ingest`` is set,
+            otherwise None. It is also stored under the config's "buffer" key.
+
+        Example:
+            >>> ticks = app.add_streaming_chart(url, ingest=True)
+            >>> latest = ticks[-1] if ticks else None
         """
-        self.streaming_charts.append({
+        chart_config = {
             "websocket_url": websocket_url,
             "topic": topic,
             "height": height,
             "candle_interval": candle_interval,
             "key": key,
-        })
+            "ingest": ingest,
+            "ingest_maxlen": ingest_maxlen,
+            "buffer": None,
+        }
+        if ingest:
+            chart_config["buffer"] = self.start_ingest(chart_config)
+        self.streaming_charts.append(chart_config)
+        return chart_config["buffer"]
+
+    def start_ingest(self, chart_config: dict) -> Optional[deque]:
+        """Start, or join, server-side ingestion for a streaming chart.
+
+        The receive loop runs in a background thread and appends ticks to a
+        bounded deque; the oldest ticks are discarded when it is full. One
+        loop runs per WebSocket URL and topic and is shared by every
+        session, so reruns and new sessions do not open more sockets.
+
+        Args:
+            chart_config: Streaming chart configuration from add_streaming_chart
+
+        Returns:
+            The deque receiving the ticks, or None if no WebSocket URL is set
+        """
+        url = chart_config.get("websocket_url", "")
+        if not url:
+            return None
+        # Imported lazily since websockets/ormsgpack are optional
+        from .streaming_chart.ingest import start_ingest
+
+        return start_ingest(
+            url,
+            chart_config.get("topic", "market.data@BTC"),
+            maxlen=chart_config.get("ingest_maxlen", 10000),
+        )
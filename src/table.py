@@ -1,13 +1,325 @@
 import streamlit as st
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
 import math
-from datetime import time
+import functools
+import weakref
+from numba import njit, prange
+from datetime import date, time
+from typing import Optional
+
+_US_PER_DAY = 86_400_000_000
+_PAGE_SIZES = (10, 20, 50, 100)
+
+
+def _as_bool(series: pd.Series) -> np.ndarray:
+    """Boolean predicate values as a NumPy array, treating missing as False."""
+    return series.to_numpy(dtype=bool, na_value=False)
+
+
+def _arrow_mask(arr: pa.Array) -> np.ndarray:
+    """Arrow boolean array as a NumPy array, treating nulls as False."""
+    return pc.fill_null(arr, False).to_numpy(zero_copy_only=False)
+
+
+def _frame_cache(func):
+    """Memoize ``func(df, *args)`` per DataFrame object.
+
+    Fragment reruns pass the same DataFrame object every time, so derived
+    values (options, ranges, ...) only need computing once per frame.
+    Results are keyed on the identity of ``df`` and dropped when it is
+    garbage collected, so a new frame that reuses the id never sees stale
+    results. In-place mutation of ``df`` is not detected.
+    """
+    cache: dict = {}
+
+    @functools.wraps(func)
+    def wrapper(df: pd.DataFrame, *args):
+        frame_id = id(df)
+        entry = cache.get(frame_id)
+        if entry is None or entry[0]() is not df:
+            def evict(ref, frame_id=frame_id):
+                if cache.get(frame_id, (None,))[0] is ref:
+                    del cache[frame_id]
+
+            entry = (weakref.ref(df, evict), {})
+            cache[frame_id] = entry
+        results = entry[1]
+        if args not in results:
+            results[args] = func(df, *args)
+        return results[args]
+
+    return wrapper
+
+
+@_frame_cache
+def _unique_options(
+    df: pd.DataFrame, col: str
+) -> "np.ndarray | pd.api.extensions.ExtensionArray":
+    """Distinct non-null values of a column, in order of appearance.
+
+    Uses the Series itself so datetimes stay Timestamps (with their
+    timezone) rather than becoming ``np.datetime64`` labels.
+    """
+    arr = df[col].unique()
+    return arr[~pd.isna(arr)]
+
+
+@_frame_cache
+def _num_range(df: pd.DataFrame, col: str) -> tuple[float, float]:
+    """Minimum and maximum of a numeric column."""
+    return float(df[col].min()), float(df[col].max())
+
+
+@_frame_cache
+def _has_nulls(df: pd.DataFrame, col: str) -> bool:
+    """Whether a column contains any missing value."""
+    return bool(df[col].isna().any())
+
+
+@_frame_cache
+def _date_range(df: pd.DataFrame, col: str) -> tuple:
+    """Earliest and latest date of a datetime column."""
+    return df[col].min().date(), df[col].max().date()
+
+
+@_frame_cache
+def _as_categorical(df: pd.DataFrame, col: str) -> tuple[np.ndarray, pd.Index]:
+    """Column as integer category codes and their categories.
+
+    Missing values get code -1, like ``pd.Categorical``.
+    """
+    cat = pd.Categorical(df[col])
+    return cat.codes, cat.categories
+
+
+@_frame_cache
+def _lower_col(df: pd.DataFrame, col: str) -> pa.Array:
+    """Column values as lowercased Arrow strings, for case-insensitive matching."""
+    return pa.array(df[col].astype(str).str.lower())
+
+
+def _isin_mask(df: pd.DataFrame, col: str, values: list) -> np.ndarray:
+    """Rows whose value in ``col`` is one of ``values``.
+
+    Compares the cached integer category codes of the column instead of
+    hashing every cell.
+    """
+    codes, categories = _as_categorical(df, col)
+    wanted = categories.get_indexer(values)
+    # -1 marks values that do not occur; it must not match missing cells
+    wanted = wanted[wanted >= 0]
+    if len(wanted) == 1:
+        return codes == wanted[0]
+    return np.isin(codes, wanted)
+
+
+@_frame_cache
+def _time_parts(df: pd.DataFrame, col: str) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Split a datetime column into int64 day numbers and times of day.
+
+    Timezone-aware columns use their local wall-clock time, like ``.dt.time``.
+
+    Returns:
+        Tuple of (days since epoch, microseconds since midnight, not-null mask)
+    """
+    s = df[col]
+    if s.dt.tz is not None:
+        s = s.dt.tz_localize(None)
+    us = s.to_numpy(dtype="datetime64[us]").view("i8")
+    days = us // _US_PER_DAY
+    return days, us - days * _US_PER_DAY, ~s.isna().to_numpy()
+
+
+@njit(parallel=True, cache=True)
+def _timerange_mask(tod: np.ndarray, valid: np.ndarray, start: int, end: int, wrap: bool) -> np.ndarray:
+    """Rows whose time of day lies in [start, end], in one fused parallel pass.
+
+    Args:
+        tod: int64 microseconds since midnight of each row
+        valid: Not-null mask of the rows
+        start: Start of the range, in microseconds since midnight
+        end: End of the range, in microseconds since midnight
+        wrap: True if the range crosses midnight (start > end)
+    """
+    out = np.empty(tod.shape[0], dtype=np.bool_)
+    for i in prange(tod.shape[0]):
+        x = tod[i]
+        if wrap:
+            out[i] = valid[i] and (x >= start or x <= end)
+        else:
+            out[i] = valid[i] and x >= start and x <= end
+    return out
+
+
+def _time_to_us(t: time) -> int:
+    """Microseconds since midnight of a time of day."""
+    return ((t.hour * 60 + t.minute) * 60 + t.second) * 1_000_000 + t.microsecond
+
+
+def _date_to_days(d: date) -> int:
+    """Days since the Unix epoch of a date."""
+    return int(np.datetime64(d, "D").astype(np.int64))
+
+
+@_frame_cache
+def _sorted_col(df: pd.DataFrame, col: str) -> tuple[np.ndarray, np.ndarray]:
+    """Values of a numeric or datetime column in ascending order.
+
+    Datetime columns are keyed by their int64 day numbers (see
+    ``_time_parts``), with missing values sorted first, below any real
+    date; numeric columns are read as floats, with NaN sorted last.
+
+    Returns:
+        Tuple of (sorted keys, row positions in that order)
+    """
+    if pd.api.types.is_datetime64_any_dtype(df[col].dtype):
+        keys = _time_parts(df, col)[0]
+    else:
+        keys = df[col].to_numpy(dtype=float, na_value=np.nan)
+    perm = np.argsort(keys, kind="stable")
+    return keys[perm], perm
+
+
+def _range_mask(df: pd.DataFrame, col: str, lo, hi) -> np.ndarray:
+    """Rows whose key in ``_sorted_col`` lies in [lo, hi].
+
+    The bounds are located with two binary searches over the cached sorted
+    keys; the matching rows are one contiguous slice of the permutation.
+    Missing values never match.
+    """
+    keys, perm = _sorted_col(df, col)
+    start = np.searchsorted(keys, lo, side="left")
+    end = np.searchsorted(keys, hi, side="right")
+    mask = np.zeros(len(df), dtype=bool)
+    mask[perm[start:end]] = True
+    return mask
+
+
+@_frame_cache
+def _sort_order(df: pd.DataFrame, cols: tuple, ascending: tuple) -> np.ndarray:
+    """Row positions of the whole frame sorted by one or more columns.
+
+    Uses pandas' sort semantics (stable, missing values last). Ties keep
+    the frame order, which ``_top_rows`` reproduces, so pages served by
+    either path agree. Several keys are handled as one stable sort per key,
+    from the last key to the first, which avoids building a tuple per row.
+    Any subset of rows can then be put in order with ``order[mask[order]]``
+    instead of sorting it again.
+
+    Args:
+        df: DataFrame to sort
+        cols: Sort keys, most significant first
+        ascending: Sort direction for each key
+    """
+    if len(cols) == 1:
+        key = df[cols[0]].reset_index(drop=True)
+        return key.sort_values(ascending=ascending[0], kind="stable").index.to_numpy()
+
+    order = np.arange(len(df))
+    for col, asc in zip(reversed(cols), reversed(ascending)):
+        key = df[col].iloc[order].reset_index(drop=True)
+        order = order[key.sort_values(ascending=asc, kind="mergesort").index.to_numpy()]
+    return order
+
+
+def _sort_key(df: pd.DataFrame, col: str):
+    """Column as a plain numeric array usable for a partial sort, or None.
+
+    Only NumPy numeric, boolean and naive datetime columns without missing
+    values qualify, since pandas places missing values last whatever the
+    direction.
+    """
+    dtype = df[col].dtype
+    if not isinstance(dtype, np.dtype) or dtype.kind not in "biufM" or _has_nulls(df, col):
+        return None
+    key = df[col].to_numpy()
+    return key.view("i8") if dtype.kind == "M" else key
+
+
+def _top_rows(key: np.ndarray, rows: np.ndarray, k: int, ascending: bool) -> np.ndarray:
+    """The first ``k`` of ``rows`` in sorted order, without sorting them all.
+
+    Gives the same rows as a stable sort of ``rows`` by ``key`` (ties keep
+    the order of ``rows``) followed by ``[:k]``, in O(N + K log K).
+
+    Args:
+        key: Sort key of every row of the frame
+        rows: Ascending row positions to sort
+        k: Number of leading rows wanted (0 < k < len(rows))
+        ascending: Sort direction
+    """
+    vals = key[rows]
+    if not ascending:
+        # Order-reversing without overflow for integers
+        vals = -vals if vals.dtype.kind == "f" else ~vals
+    threshold = vals[np.argpartition(vals, k - 1)[k - 1]]
+    # Take every row below the k-th key and the earliest of its ties, so
+    # the result matches a stable sort
+    below = np.flatnonzero(vals < threshold)
+    ties = np.flatnonzero(vals == threshold)[:k - len(below)]
+    picked = np.concatenate((below, ties))
+    return rows[picked[np.lexsort((picked, vals[picked]))]]
+
+
+@_frame_cache
+def _col_arrays(df: pd.DataFrame) -> list:
+    """Underlying array of each column, in column order.
+
+    Extension dtypes (categorical, nullable, tz-aware) keep their
+    ExtensionArray so the page preserves them.
+    """
+    arrays = []
+    for i in range(len(df.columns)):
+        s = df.iloc[:, i]
+        arrays.append(s.array if isinstance(s.dtype, pd.api.extensions.ExtensionDtype) else s.to_numpy())
+    return arrays
+
+
+def _take_rows(df: pd.DataFrame, positions: np.ndarray) -> pd.DataFrame:
+    """Build a small DataFrame of the given rows from cached column arrays.
+
+    Indexes each column array directly instead of running a block-wise
+    take over the whole frame; meant for page-sized selections.
+    """
+    page = pd.DataFrame(
+        {i: arr[positions] for i, arr in enumerate(_col_arrays(df))},
+        index=df.index[positions],
+    )
+    page.columns = df.columns
+    return page
+
+
+@_frame_cache
+def _search_haystack(df: pd.DataFrame) -> pa.Array:
+    """Lowercased text of each row, with columns joined by a separator.
+
+    The separator cannot be typed into the search box, so matches never
+    span two columns. Missing cells contribute empty text, so they never
+    match but do not hide the rest of the row. Returned as an Arrow array
+    so searches run in Arrow's native substring kernel.
+    """
+    if len(df.columns) == 0:
+        return pa.array([""] * len(df))
+
+    def text(i: int) -> pd.Series:
+        s = df.iloc[:, i]
+        return s.astype(str).where(s.notna(), "")
+
+    haystack = text(0)
+    for i in range(1, len(df.columns)):
+        haystack = haystack + "\x01" + text(i)
+    return pa.array(haystack.str.lower())
 
 
 class TableManager:
     @st.fragment
     @staticmethod
     def render_table(df: pd.DataFrame, filters: list[dict], scope: str = "table"):
+        cols = tuple(df.columns)
+
         # ==== Filters trong Expander ====
         with st.expander("Bộ lọc", expanded=False):
             vals = TableManager._render_filters(df, filters, scope)
@@ -25,8 +337,6 @@ class TableManager:
 
                 st.rerun(scope="fragment")
 
-        filtered_df = TableManager._apply_filters(df, filters, vals)
-
         # ==== Controls search/sort ====
         col_search, _, col_sort_by, col_sort_order = st.columns([6, 3, 1, 1])
         with col_search:
@@ -39,7 +349,7 @@ class TableManager:
         with col_sort_by:
             sort_by = st.selectbox(
                 "Sắp xếp theo cột",
-                options=filtered_df.columns.tolist(),
+                options=cols,
                 index=0,
                 label_visibility="collapsed",
                 key=f"{scope}:sort_by",
@@ -53,34 +363,49 @@ class TableManager:
                 key=f"{scope}:sort_order",
             )
 
-        # ---- Logic: Search ----
-        if search_term:
-            mask = pd.Series(False, index=filtered_df.index)
-            q = str(search_term)
-            for c in filtered_df.columns:
-                mask |= filtered_df[c].astype(str).str.contains(q, case=False, na=False)
-            filtered_df = filtered_df[mask]
-
-        # ---- Logic: Sort ----
+        # ---- Logic: Filter / Search / Sort ----
+        # The row positions only depend on the frame, the filter values,
+        # the search term and the sort, so changing page or page size
+        # reuses them from the previous run.
         ascending = (sort_order == "Tăng dần")
-        if sort_by:
-            filtered_df = filtered_df.sort_values(by=sort_by, ascending=ascending, kind="mergesort")
+        sig = (
+            tuple((k, tuple(v) if isinstance(v, list) else v) for k, v in vals.items()),
+            search_term,
+            sort_by,
+            ascending,
+        )
+        # Only the rows up to the current page need to be in order; a later
+        # page beyond the stored prefix sorts again.
+        page_size = st.session_state.get(f"{scope}:page_size", 20)
+        needed = st.session_state.get(f"{scope}:page", 1) * page_size
+        frame_ref = st.session_state.get(f"{scope}:_frame")
+        total_rows = st.session_state.get(f"{scope}:_total")
+        if (frame_ref is not None and frame_ref() is df
+                and st.session_state.get(f"{scope}:_sig") == sig
+                and total_rows is not None
+                and len(st.session_state[f"{scope}:_indices"]) >= min(needed, total_rows)):
+            positions = st.session_state[f"{scope}:_indices"]
+        else:
+            positions, total_rows = TableManager._row_positions(
+                df, filters, vals, search_term, sort_by, ascending, scope, limit=needed
+            )
+            st.session_state[f"{scope}:_frame"] = weakref.ref(df)
+            st.session_state[f"{scope}:_sig"] = sig
+            st.session_state[f"{scope}:_indices"] = positions
+            st.session_state[f"{scope}:_total"] = total_rows
 
         # ==== Hiển thị bảng ====
-        total_rows = len(filtered_df)
-
         if total_rows == 0:
             st.info("Không có dữ liệu phù hợp với điều kiện lọc/tìm kiếm.")
             return
 
         # Tính toán phân trang
-        page_size = st.session_state.get(f"{scope}:page_size", 20)
         total_pages = max(1, math.ceil(total_rows / page_size))
         current_page = min(st.session_state.get(f"{scope}:page", 1), total_pages)
 
         start_idx = (current_page - 1) * page_size
         end_idx = min(start_idx + page_size, total_rows)
-        page_df = filtered_df.iloc[start_idx:end_idx]
+        page_df = _take_rows(df, positions[start_idx:end_idx])
 
         # Hiển thị bảng
         st.dataframe(page_df, width='stretch')
@@ -101,8 +426,8 @@ class TableManager:
             with sub_col1:
                 st.selectbox(
                     "Rows",
-                    options=[10, 20, 50, 100],
-                    index=[10, 20, 50, 100].index(page_size) if page_size in [10, 20, 50, 100] else 1,
+                    options=_PAGE_SIZES,
+                    index=_PAGE_SIZES.index(page_size) if page_size in _PAGE_SIZES else 1,
                     label_visibility="collapsed",
                     key=f"{scope}:page_size",
                 )
@@ -117,6 +442,70 @@ class TableManager:
                     key=f"{scope}:page",
                 )
 
+    @staticmethod
+    def _row_positions(
+        df: pd.DataFrame,
+        filters: list[dict],
+        values: dict,
+        search_term: str,
+        sort_by,
+        ascending: bool,
+        scope: str,
+        limit: Optional[int] = None,
+    ) -> tuple[np.ndarray, int]:
+        """
+        Positions of the rows to display, filtered, searched and sorted.
+
+        Args:
+            df: DataFrame to display.
+            filters: Filter definitions, see _filter_mask.
+            values: Current filter values, returned from render_filters().
+            search_term: Case-insensitive substring to look for in any column.
+            sort_by: Column to sort by, or None to keep the frame order.
+            ascending: Sort direction.
+            scope: Namespace of the table's session_state keys.
+            limit: Number of leading rows needed in order, or None for all.
+
+        Returns:
+            Tuple of (int64 row positions in df in display order, number of
+            matching rows). When sorting by a plain numeric column, only the
+            first `limit` positions may be returned.
+        """
+        rows = TableManager._apply_filters(df, filters, values)
+
+        # ---- Logic: Search ----
+        # One substring scan over the cached row text. The hits do not
+        # depend on the filters or the sort, so the last result is kept to
+        # serve reruns that only change those.
+        if search_term:
+            needle = str(search_term).lower()
+            cached = st.session_state.get(f"{scope}:_search_cache")
+            if cached is not None and cached[0]() is df and cached[1] == needle:
+                hits = cached[2]
+            else:
+                hits = _arrow_mask(pc.match_substring(_search_haystack(df), needle))
+                hits.flags.writeable = False
+                st.session_state[f"{scope}:_search_cache"] = (weakref.ref(df), needle, hits)
+            rows = rows[hits[rows]]
+
+        if not sort_by:
+            return rows, len(rows)
+
+        # ---- Logic: Sort ----
+        # Plain numeric keys only order the rows shown up to the current
+        # page (partial sort). Other columns use the full-frame order,
+        # cached per column, so sorting the remaining rows is a gather
+        # rather than an O(N log N) sort.
+        key = _sort_key(df, sort_by)
+        if key is not None and limit is not None and 0 < limit < len(rows):
+            return _top_rows(key, rows, limit, ascending), len(rows)
+        order = _sort_order(df, (sort_by,), (ascending,))
+        if len(rows) == len(df):
+            return order, len(rows)
+        keep = np.zeros(len(df), dtype=bool)
+        keep[rows] = True
+        return order[keep[order]], len(rows)
+
     @staticmethod
     def _render_filters(df: pd.DataFrame, filters: list[dict], scope: str) -> dict:
         """
@@ -152,16 +541,15 @@ class TableManager:
 
                 with cols[idx]:
                     if type == "multiselect":
-                        options = df[col].dropna().unique().tolist()
+                        options = _unique_options(df, col)
                         values[col] = st.multiselect(label, options, key=key)
 
                     elif type == "selectbox":
-                        options = ["All"] + df[col].dropna().unique().tolist()
+                        options = ["All", *_unique_options(df, col)]
                         values[col] = st.selectbox(label, options, key=key)
 
                     elif type == "range":
-                        fmin = float(df[col].min())
-                        fmax = float(df[col].max())
+                        fmin, fmax = _num_range(df, col)
                         values[col] = st.slider(
                             label,
                             min_value=fmin,
@@ -171,8 +559,7 @@ class TableManager:
                         )
 
                     elif type == "daterange":
-                        datemin = df[col].min().date()
-                        datemax = df[col].max().date()
+                        datemin, datemax = _date_range(df, col)
                         values[col] = st.date_input(label, value=(datemin, datemax), key=key)
 
                     elif type == "timerange":
@@ -202,9 +589,26 @@ class TableManager:
         return values
 
     @staticmethod
-    def _apply_filters(df: pd.DataFrame, filters: list[dict], values: dict) -> pd.DataFrame:
+    def _apply_filters(df: pd.DataFrame, filters: list[dict], values: dict) -> np.ndarray:
         """
-        Apply filters to DataFrame and return filtered data.
+        Apply filters to DataFrame and return the positions of the kept rows.
+
+        See _filter_mask for the filter semantics. No rows are copied; the
+        caller narrows, orders and slices the positions and materializes
+        only the rows it displays.
+
+        Returns:
+            Ascending int64 array of row positions in df.
+        """
+        mask = TableManager._filter_mask(df, filters, values)
+        if mask is None:
+            return np.arange(len(df))
+        return np.flatnonzero(mask)
+
+    @staticmethod
+    def _filter_mask(df: pd.DataFrame, filters: list[dict], values: dict) -> Optional[np.ndarray]:
+        """
+        Compute which rows of the DataFrame pass the filters.
 
         Args:
             df: DataFrame cần lọc.
@@ -218,16 +622,29 @@ class TableManager:
                 render_filters().
 
         Returns:
-            DataFrame after applying filters.
+            Boolean array with one entry per row of df (True = keep), or
+            None if no filter is active, i.e. every row is kept.
 
         Note:
             - With 'timerange', supports time range across midnight
             (e.g., 22:00 - 06:00).
-            - With 'text', case-insensitive search.
+            - With 'text', case-insensitive substring search (the value is
+            matched literally, not as a regular expression).
             - With 'multiselect/selectbox', if value is 'all_value' then
             filter will be skipped.
         """
-        mask = pd.Series(True, index=df.index)
+        # AND each active filter into one mask in place; it is allocated
+        # on the first active filter. Filters left at their default
+        # (nothing selected, "All", the full range) are skipped without
+        # touching the column.
+        mask = None
+
+        def keep(pred: np.ndarray) -> None:
+            nonlocal mask
+            if mask is None:
+                mask = np.ones(len(df), dtype=bool)
+            np.logical_and(mask, pred, out=mask)
+
         for f in filters:
             col = f["column"]
             type = f["type"]
@@ -235,37 +652,54 @@ class TableManager:
 
             if type in ("multiselect", "selectbox"):
                 # Skip filtering if value is the "all_value" (e.g., "All")
-                all_val = f.get("all_value")
-                if value == all_val:
+                # or nothing is selected
+                all_val = f.get("all_value", "All")
+                if value is None or value == all_val:
                     continue
 
-                if isinstance(value, list) and len(value) > 0:
-                    mask &= df[col].isin(value)
-                elif value is not None:
-                    mask &= df[col].eq(value)
+                if isinstance(value, list):
+                    if value:
+                        keep(_isin_mask(df, col, value))
+                else:
+                    keep(_isin_mask(df, col, [value]))
 
             elif type == "range":
                 lo, hi = value
-                mask &= df[col].between(lo, hi)
+                if (lo, hi) == _num_range(df, col) and not _has_nulls(df, col):
+                    continue
+                keep(_range_mask(df, col, lo, hi))
 
             elif type == "text":
                 if value and value.strip():
-                    mask &= df[col].astype(str).str.contains(value.strip(), case=False, na=False)
+                    keep(_arrow_mask(
+                        pc.match_substring(_lower_col(df, col), value.strip().lower())
+                    ))
 
             elif type == "checkbox":
                 if value is True:
-                    mask &= df[col].astype(bool)
+                    keep(_as_bool(df[col].astype(bool)))
 
             elif type == "daterange":
+                # The date picker returns a single date while a range is
+                # being selected; leave the filter off until it is complete
+                if not isinstance(value, (tuple, list)) or len(value) != 2:
+                    continue
                 start, end = value
-                mask &= df[col].dt.date.between(start, end)
+                if (start, end) == _date_range(df, col) and not _has_nulls(df, col):
+                    continue
+                # Compare int64 day numbers instead of datetime.date objects
+                keep(_range_mask(df, col, _date_to_days(start), _date_to_days(end)))
 
             elif type == "timerange":
+                # Compare int64 microseconds since midnight instead of
+                # datetime.time objects
                 start_time, end_time = value
-                col_time = df[col].dt.time
-                if start_time <= end_time:
-                    mask &= (col_time >= start_time) & (col_time <= end_time)
-                else:
-                    mask &= (col_time >= start_time) | (col_time <= end_time)
+                if start_time == time.min and end_time == time.max and not _has_nulls(df, col):
+                    continue
+                _, tod, valid = _time_parts(df, col)
+                keep(_timerange_mask(
+                    tod, valid, _time_to_us(start_time), _time_to_us(end_time),
+                    start_time > end_time,
+                ))
 
-        return df[mask]
+        return mask
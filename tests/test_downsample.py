@@ -0,0 +1,46 @@
+import numpy as np
+import pandas as pd
+
+from src.downsample import downsample_indices, lttb_indices
+
+
+def test_lttb_keeps_endpoints_and_returns_sorted_unique_indices():
+    rng = np.random.default_rng(0)
+    x = np.arange(10_000, dtype=np.float64)
+    y = rng.standard_normal(10_000).cumsum()
+
+    idx = lttb_indices(x, y, 500)
+
+    assert len(idx) == 500
+    assert idx[0] == 0
+    assert idx[-1] == 9_999
+    assert np.all(np.diff(idx) > 0)
+
+
+def test_lttb_passes_short_series_through():
+    x = np.arange(10, dtype=np.float64)
+    y = np.arange(10, dtype=np.float64)
+
+    assert lttb_indices(x, y, 10).tolist() == list(range(10))
+    assert lttb_indices(x, y, 50).tolist() == list(range(10))
+
+
+def test_downsample_indices_with_datetime_x():
+    x = pd.Series(pd.date_range("2024-01-01", periods=5_000, freq="min", tz="UTC"))
+    y = pd.Series(np.sin(np.linspace(0, 20, 5_000)))
+
+    idx = downsample_indices(x, y, 300)
+    expected = lttb_indices(
+        np.arange(5_000, dtype=np.float64) * 60e9 + x.iloc[0].value, y.to_numpy(), 300
+    )
+
+    assert idx.tolist() == expected.tolist()
+    assert idx[0] == 0
+    assert idx[-1] == 4_999
+
+
+def test_downsample_indices_keeps_every_row_for_non_numeric_y():
+    x = pd.Series(np.arange(100))
+    y = pd.Series([f"v{i}" for i in range(100)])
+
+    assert downsample_indices(x, y, 10).tolist() == list(range(100))
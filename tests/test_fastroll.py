@@ -0,0 +1,33 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.fastroll import multi_rolling_mean, rolling_mean
+
+
+def _series():
+    rng = np.random.default_rng(0)
+    x = rng.standard_normal(50).cumsum() + 100.0
+    x[[7, 30, 31]] = np.nan
+    return x
+
+
+@pytest.mark.parametrize("w", [1, 3, 10, 50, 80])
+def test_rolling_mean_matches_pandas(w):
+    x = _series()
+    out = np.empty_like(x)
+
+    rolling_mean(x, w, out)
+
+    np.testing.assert_allclose(out, pd.Series(x).rolling(w).mean().to_numpy())
+
+
+def test_multi_rolling_mean_matches_pandas():
+    x = _series()
+    windows = np.array([1, 5, 20, 60], dtype=np.int64)
+    out = np.empty((len(windows), len(x)))
+
+    multi_rolling_mean(x, windows, out)
+
+    for row, w in zip(out, windows):
+        np.testing.assert_allclose(row, pd.Series(x).rolling(w).mean().to_numpy())
@@ -0,0 +1,128 @@
+from datetime import date, time, timedelta
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.table import (
+    TableManager,
+    _date_to_days,
+    _range_mask,
+    _time_parts,
+    _time_to_us,
+    _timerange_mask,
+    _unique_options,
+)
+
+
+def _search(df: pd.DataFrame, term: str) -> list:
+    positions, _ = TableManager._row_positions(df, [], {}, term, None, True, "test")
+    return positions.tolist()
+
+
+def test_search_matches_rows_with_missing_cells():
+    df = pd.DataFrame({"name": ["alpha", None, "gamma"], "city": ["Hanoi", "Hue", None]})
+
+    assert _search(df, "alp") == [0]
+    assert _search(df, "hu") == [1]
+    assert _search(df, "gam") == [2]
+
+
+def test_search_does_not_match_missing_cells():
+    df = pd.DataFrame({"value": [1.5, np.nan], "label": ["a", "b"]})
+
+    assert _search(df, "nan") == []
+
+
+def test_pages_of_a_tied_sort_cover_every_row_once():
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({"key": rng.integers(0, 5, 500), "other": np.arange(500)})
+
+    for ascending in (True, False):
+        full, total = TableManager._row_positions(df, [], {}, "", "key", ascending, "test")
+        pages = []
+        for page in range(1, 6):
+            positions, _ = TableManager._row_positions(
+                df, [], {}, "", "key", ascending, "test", limit=page * 100
+            )
+            pages.extend(positions[(page - 1) * 100:page * 100].tolist())
+
+        assert total == 500
+        assert pages == full.tolist()
+        assert sorted(pages) == list(range(500))
+
+
+def test_unique_options_keep_timestamps():
+    dates = pd.to_datetime(["2024-01-02", None, "2024-01-01", "2024-01-02"])
+    df = pd.DataFrame({"naive": dates, "aware": dates.tz_localize("Asia/Ho_Chi_Minh")})
+
+    naive = list(_unique_options(df, "naive"))
+
+    assert naive == [pd.Timestamp("2024-01-02"), pd.Timestamp("2024-01-01")]
+    assert all(type(value) is pd.Timestamp for value in naive)
+    assert list(_unique_options(df, "aware")) == [
+        pd.Timestamp("2024-01-02", tz="Asia/Ho_Chi_Minh"),
+        pd.Timestamp("2024-01-01", tz="Asia/Ho_Chi_Minh"),
+    ]
+
+
+def _timestamps(tz=None) -> pd.DataFrame:
+    rng = np.random.default_rng(1)
+    seconds = rng.integers(-5 * 365 * 86_400, 5 * 365 * 86_400, 300)
+    stamps = pd.Series(pd.to_datetime(seconds, unit="s") + pd.Timedelta("123us"))
+    stamps.iloc[[0, 50, 299]] = pd.NaT
+    if tz is not None:
+        stamps = stamps.dt.tz_localize("UTC").dt.tz_convert(tz)
+    return pd.DataFrame({"ts": stamps})
+
+
+def test_range_mask_matches_between():
+    rng = np.random.default_rng(2)
+    values = rng.integers(-50, 50, 200).astype(float)
+    values[[3, 60, 61]] = np.nan
+    df = pd.DataFrame({"x": values})
+
+    for lo, hi in [(-10, 10), (-50, 49), (5, 5), (20, -20), (100, 200)]:
+        expected = df["x"].between(lo, hi).to_numpy()
+        assert (_range_mask(df, "x", lo, hi) == expected).all()
+
+
+@pytest.mark.parametrize("tz", [None, "Asia/Ho_Chi_Minh", "America/New_York"])
+def test_time_parts_match_dt_accessors(tz):
+    df = _timestamps(tz)
+    days, tod, valid = _time_parts(df, "ts")
+    s = df["ts"]
+
+    assert (valid == s.notna().to_numpy()).all()
+    assert (days[valid] < 0).any()
+    dates = [date(1970, 1, 1) + timedelta(days=int(d)) for d in days[valid]]
+    assert dates == s.dt.date.dropna().tolist()
+    assert tod[valid].tolist() == [_time_to_us(t) for t in s.dt.time.dropna()]
+
+
+@pytest.mark.parametrize("tz", [None, "Asia/Ho_Chi_Minh"])
+def test_daterange_mask_matches_dt_date(tz):
+    df = _timestamps(tz)
+    dates = df["ts"].dt.date
+
+    ranges = [(date(1966, 3, 1), date(1969, 12, 31)), (date(1968, 1, 1), date(1972, 6, 30))]
+    for start, end in ranges:
+        expected = dates.map(lambda d: pd.notna(d) and start <= d <= end).to_numpy(dtype=bool)
+        mask = _range_mask(df, "ts", _date_to_days(start), _date_to_days(end))
+        assert (mask == expected).all()
+
+
+@pytest.mark.parametrize("tz", [None, "Asia/Ho_Chi_Minh"])
+def test_timerange_mask_matches_dt_time(tz):
+    df = _timestamps(tz)
+    _, tod, valid = _time_parts(df, "ts")
+    times = df["ts"].dt.time
+
+    for start, end in [(time(9, 0), time(17, 30)), (time(22, 0), time(2, 0, 0, 123))]:
+        wrap = start > end
+        if wrap:
+            expected = times.map(lambda t: pd.notna(t) and (t >= start or t <= end))
+        else:
+            expected = times.map(lambda t: pd.notna(t) and start <= t <= end)
+        mask = _timerange_mask(tod, valid, _time_to_us(start), _time_to_us(end), wrap)
+        assert (mask == expected.to_numpy(dtype=bool)).all()